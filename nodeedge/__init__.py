@@ -5,9 +5,18 @@ from .constants import Undefined
 __all__ = ["Undefined", "ValueClass", "UndefinedType", "GlobalConfiguration"]
 
 
-class GlobalConfiguration(metaclass=ValueClass):
+class _GlobalConfigurationClass(ValueClass):
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name == "BACKEND":
+            # keep the derived flag in sync whenever the backend is reconfigured
+            super().__setattr__("_is_edgedb_backend", "edgedb" in value)
+
+
+class GlobalConfiguration(metaclass=_GlobalConfigurationClass):
     BACKEND = "nodeedge.backends.edgedb"
+    _is_edgedb_backend = "edgedb" in BACKEND
 
     @classmethod
     def is_edgedb_backend(cls):
-        return "edgedb" in cls.BACKEND
+        return cls._is_edgedb_backend
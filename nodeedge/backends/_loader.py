@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 from importlib import import_module
-from typing import Union, cast
+from typing import Tuple
 
 
 from nodeedge.backends.base import FieldTypeMap
@@ -15,30 +15,28 @@ class BaseBackendLoader(type):
     __instances: dict[str, BackendLoader] = {}
 
     def __call__(cls, namespace: str):
-        if namespace not in cls.__instances:
-            cls.__instances[namespace] = super().__call__(namespace)
-        return cls.__instances[namespace]
+        instance = cls.__instances.get(namespace)
+        if instance is None:
+            instance = cls.__instances[namespace] = super().__call__(namespace)
+        return instance
+
+
+def _parse_backend(backend: str) -> Tuple[str, str, str]:
+    package, *back_namespace, name = backend.split(".")
+    base_namespace = ".".join(back_namespace)
+    return package, f"{package}.{base_namespace}", name
 
 
 class BackendLoader(metaclass=BaseBackendLoader):
     name: str
     package: str
     base_namespace: str
-    _field_type_map: Union[FieldTypeMap, None]
+    namespace: str
 
     def __init__(self, backend: str):
-        self.package, *back_namespace, self.name = backend.split(".")
-        base_namespace = ".".join(back_namespace)
-        self.base_namespace = f"{self.package}.{base_namespace}"
-        self._field_type_map = None
-
-    @cached_property
-    def namespace(self):
-        return f"{self.base_namespace}.{self.name}"
+        self.package, self.base_namespace, self.name = _parse_backend(backend)
+        self.namespace = f"{self.base_namespace}.{self.name}"
 
     @cached_property
     def field_type_map(self) -> FieldTypeMap:
-        if not self._field_type_map:
-            mod = import_module(self.namespace, package=self.package)
-            self._field_type_map = mod.type_map
-        return cast(FieldTypeMap, self._field_type_map)
+        return import_module(self.namespace, package=self.package).type_map
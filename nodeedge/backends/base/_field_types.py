@@ -9,7 +9,7 @@ LinkIdFieldType: TypeAlias = Literal["uuid"]
 MultiLinkIdFieldType: TypeAlias = Literal["array<uuid>"]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FieldTypeMap:
     Bool: str
     Str: str
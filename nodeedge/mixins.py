@@ -3,7 +3,9 @@ from __future__ import annotations
 import abc
 import dataclasses
 import inspect
-from types import EllipsisType
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+import keyword
+from types import FunctionType, MappingProxyType
 from typing import (
     FrozenSet,
     Tuple,
@@ -18,7 +20,6 @@ from typing import (
     Type,
     Literal,
     Callable,
-    cast,
 )
 
 from typing_extensions import Self, TypeAlias
@@ -49,14 +50,31 @@ _BUILD_IN_ATTRS = frozenset(dir(object) + dir(type))
 
 _CloningAttrsType: TypeAlias = Union[FrozenSet[str], Tuple[str, ...]]
 
+_InitArgsType: TypeAlias = Tuple[Tuple[str, ...], FrozenSet[str]]
+
+# `__init__` function -> (init args, init kwargs)
+_SIG_CACHE: Dict[Callable, _InitArgsType] = {}
+
+_SKIP_ARG_NAMES = frozenset(["__pydantic_self__"])
+
+_EMPTY: MappingProxyType = MappingProxyType({})
+
 
 class Cloneable(abc.ABC):
     __is_mixin__ = True
     __allow_mixin_operation__ = True
     __cloning_attrs__: _CloningAttrsType = frozenset(["__is_mixin__", "__allow_mixin_operation__"])
+    __cloning_attrs_tuple__: Tuple[str, ...] = ("__allow_mixin_operation__", "__is_mixin__")
     __init_args__: Tuple[str, ...] = ()
     __init_kwargs__: FrozenSet[str] = frozenset()
     __cloning_operator__: Union[Callable[[Self], Self], None] = None
+    # name of an alternate classmethod constructor to use instead of the class call,
+    # for clones which do not replace init args
+    __cloning_constructor__: Union[str, None] = None
+    # clone by a shallow `__dict__` copy instead of calling `__init__` again; opt-in for
+    # concrete classes whose instances hold no mutable state and take no derived attributes
+    __fast_clone__: bool = False
+    __clone_impl__: Callable[..., Self]
 
     def __init_subclass__(cls, **kwargs):
         if cls is Cloneable:
@@ -65,11 +83,10 @@ class Cloneable(abc.ABC):
         if getattr(cls, "__allow_mixin_operation__", True):
             _extend_cloning_attrs(cls)
             _extend_cloning_args(cls)
+            _install_clone_impl(cls)
 
         return super().__init_subclass__(**kwargs)
 
-    __skip_arg_names = frozenset(["__pydantic_self__"])
-
     def _clone(
         self,
         *,
@@ -77,45 +94,7 @@ class Cloneable(abc.ABC):
         kwargs: Optional[Dict] = None,
         attrs: Optional[Dict] = None,
     ) -> Self:
-        init_args = []
-        init_kwargs = {}
-
-        args = args or {}
-        kwargs = kwargs or {}
-        attrs = attrs or {}
-
-        for name in self.__init_args__:
-            if name in self.__skip_arg_names:
-                continue
-            if name in args:
-                init_args.append(args[name])
-            else:
-                init_args.append(getattr(self, name))
-
-        for name in self.__init_kwargs__:
-            if name in self.__skip_arg_names:
-                continue
-            if name in args:
-                continue
-            if name in kwargs:
-                init_kwargs[name] = kwargs[name]
-            else:
-                init_kwargs[name] = getattr(self, name)
-
-        if callable(self.__cloning_operator__):
-            obj = self.__cloning_operator__(self)
-        else:
-            obj = self.__class__(*init_args, **init_kwargs)  # type: ignore
-
-        for attr in self.__cloning_attrs__:
-            if attr in attrs:
-                continue
-            setattr(obj, attr, getattr(self, attr))
-
-        for attr, value in attrs.items():
-            setattr(obj, attr, value)
-
-        return obj
+        return type(self).__clone_impl__(self, args=args, kwargs=kwargs, attrs=attrs)
 
     @staticmethod
     def required_cloneable_inheritance(obj: Any):
@@ -128,27 +107,178 @@ class Cloneable(abc.ABC):
             raise TypeError("required to inherit Cloneable")
 
 
-def _extend_cloning_attrs(cls):
-    attr_name = "__cloning_attrs__"
-    cloning_attrs = frozenset(getattr(cls, attr_name, []))
-    for _t in cls.__bases__:
-        if _t in [Cloneable, abc.ABC, abc.ABCMeta]:
+def _compile_clone_impl(cls) -> Callable:
+    """`cls`의 init args와 cloning attrs를 풀어 쓴 `_clone` 구현을 생성합니다."""
+
+    def _is_name(name: str) -> bool:
+        return name.isidentifier() and not keyword.iskeyword(name)
+
+    def _load(obj: str, name: str) -> str:
+        if _is_name(name):
+            return f"{obj}.{name}"
+        return f"getattr({obj}, {name!r})"
+
+    def _store(name: str, value: str) -> str:
+        if _is_name(name):
+            return f"obj.{name} = {value}"
+        return f"setattr(obj, {name!r}, {value})"
+
+    init_args = [_n for _n in cls.__init_args__ if _n not in _SKIP_ARG_NAMES]
+    init_kwargs = sorted(cls.__init_kwargs__ - _SKIP_ARG_NAMES)
+
+    # the alternate constructor may skip validation, so it only gets the current init args
+    constructor = "self.__class__"
+    if cls.__cloning_constructor__:
+        constructor = _load(constructor, cls.__cloning_constructor__)
+
+    # the class is called with `args`/`kwargs` merged into the current init args
+    construct = [
+        "args = args or _EMPTY",
+        "kwargs = kwargs or _EMPTY",
+        "init_kwargs = {}",
+    ]
+    for name in init_kwargs:
+        construct.append(f"if {name!r} not in args:")
+        construct.append(
+            f"    init_kwargs[{name!r}] = "
+            f"kwargs[{name!r}] if {name!r} in kwargs else {_load('self', name)}"
+        )
+    call_args = [f"args[{_n!r}] if {_n!r} in args else {_load('self', _n)}" for _n in init_args]
+    call_args.append("**init_kwargs")
+    construct.append(f"obj = self.__class__({', '.join(call_args)})")
+
+    lines = ["def _clone(self, *, args=None, kwargs=None, attrs=None):"]
+    if cls.__fast_clone__ and not callable(cls.__cloning_operator__):
+        # a shallow copy of the instance is only taken when init args are not replaced,
+        # since subclasses may derive attributes from them or expose them as properties
+        lines.append("    if not args and not kwargs:")
+        lines.append("        obj = _new(self.__class__)")
+        lines.append("        obj.__dict__.update(self.__dict__)")
+        lines.append("    else:")
+        lines.extend(f"        {_line}" for _line in construct)
+        for name in cls.__cloning_attrs_tuple__:
+            lines.append(f"        if not attrs or {name!r} not in attrs:")
+            lines.append(f"            {_store(name, _load('self', name))}")
+    else:
+        lines.append("    cloning_operator = self.__cloning_operator__")
+        lines.append("    if callable(cloning_operator):")
+        lines.append("        obj = cloning_operator(self)")
+
+        # most clones only override attrs, so their init args are passed as they are
+        call_args = [_load("self", _n) for _n in init_args]
+        call_args += [f"{_n}={_load('self', _n)}" for _n in init_kwargs if _is_name(_n)]
+        other_kwargs = [f"{_n!r}: {_load('self', _n)}" for _n in init_kwargs if not _is_name(_n)]
+        if other_kwargs:
+            call_args.append(f"**{{{', '.join(other_kwargs)}}}")
+        lines.append("    elif not args and not kwargs:")
+        lines.append(f"        obj = {constructor}({', '.join(call_args)})")
+
+        lines.append("    else:")
+        lines.extend(f"        {_line}" for _line in construct)
+
+        if cls.__cloning_attrs_tuple__:
+            lines.append("    if not attrs:")
+            for name in cls.__cloning_attrs_tuple__:
+                lines.append(f"        {_store(name, _load('self', name))}")
+            lines.append("        return obj")
+            for name in cls.__cloning_attrs_tuple__:
+                lines.append(f"    if {name!r} not in attrs:")
+                lines.append(f"        {_store(name, _load('self', name))}")
+
+    lines.append("    if attrs:")
+    lines.append("        for attr, value in attrs.items():")
+    lines.append("            setattr(obj, attr, value)")
+    return _exec_clone_impl(cls, lines)
+
+
+def _exec_clone_impl(cls, lines: List[str]) -> Callable:
+    lines.append("    return obj")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), {"_EMPTY": _EMPTY, "_new": object.__new__}, namespace)
+    impl = namespace["_clone"]
+    impl.__qualname__ = f"{cls.__qualname__}._clone"
+    impl.__is_generated_clone__ = True
+    return impl
+
+
+def _install_clone_impl(cls):
+    """생성한 `_clone` 구현을 `cls`에 붙입니다. `_clone`을 재정의한 클래스는 그대로 둡니다."""
+    impl = cls.__clone_impl__ = _compile_clone_impl(cls)
+    for _t in cls.__mro__:
+        current = _t.__dict__.get("_clone")
+        if current is None or getattr(current, "__requires_cloneable__", False):
             continue
+        if current is Cloneable.__dict__["_clone"] or getattr(
+            current, "__is_generated_clone__", False
+        ):
+            cls._clone = impl
+        break
+
+
+def _clone_attr(obj: Any, name: str, value: Any) -> Any:
+    """`obj._clone(attrs={name: value})`와 같지만 attrs 없이 복제한 뒤 값을 설정합니다."""
+    cloned = obj._clone()
+    setattr(cloned, name, value)
+    return cloned
+
 
-        attr = getattr(_t, attr_name, None)
-        if isinstance(attr, (tuple, set)):
-            cloning_attrs = cloning_attrs.union(frozenset(attr))
-        elif isinstance(attr, frozenset):
-            cloning_attrs = cloning_attrs.union(attr)
+def _requires_cloneable(func: Callable) -> Callable:
+    """Cloneable 상속 여부만 확인하는 mixin의 `_clone`을 표시합니다.
 
-    setattr(cls, attr_name, cloning_attrs)
+    Cloneable을 상속한 클래스에서는 생성한 `_clone`이 이 메서드를 가리므로 확인은 상속하지 않은
+    클래스에서만 일어납니다.
+    """
+    func.__requires_cloneable__ = True  # type: ignore
+    return func
+
+
+Cloneable.__clone_impl__ = _compile_clone_impl(Cloneable)
+
+
+def _extend_cloning_attrs(cls):
+    cls.__cloning_attrs__ = frozenset().union(
+        *(_t.__dict__.get("__cloning_attrs__", ()) for _t in cls.__mro__ if _t is not Cloneable)
+    )
+    cls.__cloning_attrs_tuple__ = tuple(sorted(cls.__cloning_attrs__))
 
 
 def _extend_cloning_args(cls):
     if not isinstance(getattr(cls, "__cloning_attrs__", None), (frozenset, tuple)):
         raise TypeError(f"{cls.__name__}._cloning_attrs must be a frozenset or tuple")
 
-    sig = inspect.signature(cls.__init__)
+    # subclasses which inherit `__init__` hit the cache entry of the same function
+    init = cls.__init__
+    cached = _SIG_CACHE.get(init)
+    if cached is None:
+        cached = _SIG_CACHE[init] = _inspect_init_args(init)
+
+    cls.__init_args__, cls.__init_kwargs__ = cached
+
+
+def _inspect_init_args(init: Callable) -> _InitArgsType:
+    if type(init) is not FunctionType or hasattr(init, "__wrapped__"):
+        return _inspect_init_signature(init)
+
+    code = init.__code__
+    n_args = code.co_argcount
+    n_kwargs = n_args + code.co_kwonlyargcount
+    names = code.co_varnames
+    init_args = [_n for _n in names[:n_args] if _n != "self"]
+    init_kwargs = {_n for _n in names[n_args:n_kwargs] if _n != "self"}
+    if code.co_flags & CO_VARARGS:
+        if names[n_kwargs] not in ("self", "args"):
+            init_args.append(names[n_kwargs])
+        n_kwargs += 1
+    if code.co_flags & CO_VARKEYWORDS:
+        if names[n_kwargs] not in ("self", "kwargs"):
+            init_kwargs.add(names[n_kwargs])
+
+    return tuple(init_args), frozenset(init_kwargs)
+
+
+def _inspect_init_signature(init: Callable) -> _InitArgsType:
+    sig = inspect.signature(init)
     init_args: List[str] = []
     init_kwargs: Set[str] = set()
     for name, param in sig.parameters.items():
@@ -167,8 +297,7 @@ def _extend_cloning_args(cls):
         elif param.kind in [param.KEYWORD_ONLY, param.VAR_KEYWORD]:
             init_kwargs.add(name)
 
-    cls.__init_args__ = tuple(init_args)
-    cls.__init_kwargs__ = frozenset(init_kwargs)
+    return tuple(init_args), frozenset(init_kwargs)
 
 
 _Valueable_T = TypeVar("_Valueable_T")
@@ -177,9 +306,29 @@ _Valueable_T = TypeVar("_Valueable_T")
 class Valueable(abc.ABC, Generic[_Valueable_T]):
     __is_mixin__ = True
     __allow_mixin_operation__ = True
-    __cloning_attrs__: _CloningAttrsType = frozenset(["__value__", "__value_type__"])
+    __cloning_attrs__: _CloningAttrsType = frozenset(["__value__"])
     __value__: Union[_Valueable_T, UndefinedType] = Undefined
-    __value_type__: Union[FrozenSet[Type], EllipsisType, None] = ...
+    __value_type__: Union[FrozenSet[Type], None] = None
+    __value_type_single__: Union[Type, None] = None
+    __value_type_tuple__: Union[Tuple[Type, ...], None] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__value_type__ = None
+        for _base in getattr(cls, "__orig_bases__", ()):
+            if get_origin(_base) is Valueable:
+                cls.__value_type__ = frozenset(_base.__args__)
+                break
+
+        # most Valueables bind a single type, which is checked by identity,
+        # and a few types are scanned faster as a tuple than hashed into a frozenset
+        value_type = cls.__value_type__
+        cls.__value_type_single__ = (
+            next(iter(value_type)) if value_type and len(value_type) == 1 else None
+        )
+        cls.__value_type_tuple__ = (
+            tuple(value_type) if value_type and 1 < len(value_type) <= 4 else None
+        )
 
     @staticmethod
     def required_valueable_inheritance(obj: Any):
@@ -191,26 +340,24 @@ class Valueable(abc.ABC, Generic[_Valueable_T]):
         if Valueable not in mro:
             raise TypeError("required to inherit Valueable")
 
-    def __set_value_type(self):
-        if self.__value_type__ is not ...:
+    def check_value(self, value: Any):
+        single_type = self.__value_type_single__
+        if single_type is not None:
+            if type(value) is not single_type:
+                raise TypeError(f"bad operand type for bind: {type(value).__name__!r}")
             return None
-        for _base in getattr(self, "__orig_bases__", ()):
-            if get_origin(_base) is Valueable:
-                self.__value_type__ = frozenset(_base.__args__)
-                return None
 
-        self.__value_type__ = None
-        return None
-
-    def check_value(self, value: Any):
-        self.__set_value_type()
-        if self.__value_type__ is ...:
-            self.__set_value_type()
-        if not self.__value_type__:
+        value_type_tuple = self.__value_type_tuple__
+        if value_type_tuple is not None:
+            if type(value) not in value_type_tuple:
+                raise TypeError(f"bad operand type for bind: {type(value).__name__!r}")
             return None
-        if type(value) not in cast(frozenset, self.__value_type__):
+
+        value_type = self.__value_type__
+        if value_type and type(value) not in value_type:
             raise TypeError(f"bad operand type for bind: {type(value).__name__!r}")
 
+    @_requires_cloneable
     def _clone(self, **kwargs):
         Cloneable.required_cloneable_inheritance(self)
         return super()._clone(**kwargs)  # type: ignore
@@ -227,23 +374,40 @@ class Valueable(abc.ABC, Generic[_Valueable_T]):
         else:
             self.check_value(value)
 
-        return self._clone(attrs={"__value__": value})
+        return _clone_attr(self, "__value__", value)
 
     def __pos__(self) -> Self:
-        if hasattr(self.__value__, "__pos__"):
-            return self._clone(attrs={"__value__": +self.__value__})
+        if getattr(type(self.__value__), "__pos__", None) is not None:
+            return _clone_attr(self, "__value__", +self.__value__)
         raise TypeError(f"bad operand type for unary +: {type(self.__value__).__name__!r}")
 
     positive = __pos__
 
     def __neg__(self) -> Self:
-        if hasattr(self.__value__, "__neg__"):
-            return self._clone(attrs={"__value__": -self.__value__})
+        if getattr(type(self.__value__), "__neg__", None) is not None:
+            return _clone_attr(self, "__value__", -self.__value__)
         raise TypeError(f"bad operand type for unary -: {type(self.__value__).__name__!r}")
 
     negative = __neg__
 
 
+_AND = EnumOperand.AND
+_OR = EnumOperand.OR
+
+
+def _is_compositable(obj: Any) -> bool:
+    # a class flag avoids going through `ABCMeta.__instancecheck__`
+    return getattr(type(obj), "__is_compositable__", False)
+
+
+def _is_composition(obj: Any) -> bool:
+    return getattr(type(obj), "__is_composition__", False)
+
+
+def _is_pathable(obj: Any) -> bool:
+    return getattr(type(obj), "__is_pathable__", False)
+
+
 CompositedDirectionType: TypeAlias = Literal["left", "right", ""]
 
 _CompositionItemResult_T = TypeVar("_CompositionItemResult_T")
@@ -254,6 +418,7 @@ _CompositableClass_T = TypeVar("_CompositableClass_T", bound="Composition")
 class Compositable(abc.ABC, Generic[_CompositionItemResult_T]):
     __is_mixin__ = True
     __allow_mixin_operation__ = True
+    __is_compositable__ = True
     __operand__: EnumOperand
     __cloning_attrs__: _CloningAttrsType = frozenset(["__operand__"])
 
@@ -263,13 +428,13 @@ class Compositable(abc.ABC, Generic[_CompositionItemResult_T]):
 
     @operand.setter
     def operand(self, value: EnumOperand):
-        if not isinstance(value, EnumOperand):
+        if type(value) is not EnumOperand:
             raise InvalidCompositedTypeError("operand must be an instance of EnumOperand")
         self.__operand__ = value
 
     @staticmethod
     def _check_compositable(other: Compositable):
-        if not isinstance(other, Compositable):
+        if not _is_compositable(other):
             raise NotAllowedCompositionError("other must be an instance of Compositable")
 
     @abc.abstractmethod
@@ -317,12 +482,14 @@ class CompositableItem(
 
         raise TypeError("CompositableItem subclass must be a subclass of Composition")
 
+    @_requires_cloneable
     def _clone(self, **kwargs):
         Cloneable.required_cloneable_inheritance(self)
         return super()._clone(**kwargs)  # type: ignore
 
     def __hash__(self):
-        return hash((self.__class__, id(self), self.operand))
+        # each instance is unique by its id, so no tuple is needed to mix in the operand
+        return id(self) ^ hash(type(self))
 
     def __repr__(self):
         return f"{self.__class__.__name__}<{self.__hash__()}>"
@@ -331,11 +498,11 @@ class CompositableItem(
 
     def __and__(self, other: Compositable) -> _CompositableClass_T:
         self._check_compositable(other)
-        return self.__compositable_class__.create_composition(self, EnumOperand.AND, other)
+        return self.__compositable_class__.create_composition(self, _AND, other)
 
     def __or__(self, other: Compositable) -> _CompositableClass_T:
         self._check_compositable(other)
-        return self.__compositable_class__.create_composition(self, EnumOperand.OR, other)
+        return self.__compositable_class__.create_composition(self, _OR, other)
 
 
 OnCompositionType: TypeAlias = Callable[
@@ -344,7 +511,7 @@ OnCompositionType: TypeAlias = Callable[
 ]
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class CompositionListener:
     on_composite: Callable[
         [
@@ -365,10 +532,12 @@ class CompositionListener:
     ]
 
 
+_noop = lambda *args, **kwargs: None
+
 _default_composition_listener = CompositionListener(
-    on_composite=lambda item, operand=None, direction=None, depth=None: None,  # type: ignore
-    on_begin_wrap=lambda depth, item=None: None,  # type: ignore
-    on_finish_wrap=lambda depth, item=None: None,  # type: ignore
+    on_composite=_noop,
+    on_begin_wrap=_noop,
+    on_finish_wrap=_noop,
 )
 
 
@@ -377,10 +546,11 @@ class Composition(
     abc.ABC,
     Generic[_CompositionItemResult_T],
 ):
+    __is_composition__ = True
     __cloning_attrs__: _CloningAttrsType = frozenset(["__listener__", "__operand__"])
 
-    __left__: Compositable
-    __right__: Compositable
+    __left__: Union[Compositable, None] = None
+    __right__: Union[Compositable, None] = None
     __listener__: CompositionListener = _default_composition_listener
     __operand__: EnumOperand = EnumOperand.AND
 
@@ -389,7 +559,8 @@ class Composition(
         cls, left: Compositable, operand: EnumOperand, right: Compositable
     ) -> Self:
         cls.check_composition_args(left, operand, right)
-        obj = cls()
+        # compositions keep no state but the attributes below, unless a subclass has `__init__`
+        obj = object.__new__(cls) if cls.__init__ is object.__init__ else cls()
         obj.__left__ = left
         obj.__right__ = right
         obj.__operand__ = operand
@@ -397,12 +568,15 @@ class Composition(
 
     @classmethod
     def check_composition_args(cls, left: Compositable, operand: EnumOperand, right: Compositable):
-        if not isinstance(left, Compositable) or not isinstance(right, Compositable):
+        if not _is_compositable(left) or not _is_compositable(right):
             raise TypeError("Cannot compose non-compositable types")
+        if type(operand) is EnumOperand:
+            return
         operand = EnumOperand.find_member(operand)
         if not isinstance(operand, EnumOperand):
             raise TypeError("operand must be an instance of EnumOperand")
 
+    @_requires_cloneable
     def _clone(self, **kwargs):
         Cloneable.required_cloneable_inheritance(self)
         return super()._clone(**kwargs)  # type: ignore
@@ -412,54 +586,70 @@ class Composition(
 
     def __and__(self, other: Compositable) -> Self:
         self._check_compositable(other)
-        return self._clone(args={"left": self, "operand": EnumOperand.AND, "right": other})
+        return self._clone(args={"left": self, "operand": _AND, "right": other})
 
     def __or__(self, other: Compositable) -> Self:
         self._check_compositable(other)
-        return self._clone(args={"left": self, "operand": EnumOperand.OR, "right": other})
+        return self._clone(args={"left": self, "operand": _OR, "right": other})
 
     def map_composition(self, listener: Optional[CompositionListener] = None) -> None:
         """
         depth: composition depth
         """
-        depth = 0
+        _listener = self.__listener__ if listener is None else listener
+        if _listener is None or _listener is _default_composition_listener:
+            return None
 
-        _listener = listener or self.__listener__ or _default_composition_listener
+        on_composite = _listener.on_composite
+        on_begin_wrap = _listener.on_begin_wrap
+        on_finish_wrap = _listener.on_finish_wrap
+        depth = 0
 
-        def _traverse(
-            item: Union[Compositable, None],
-            direction: CompositedDirectionType = "",
-            operand: Optional[EnumOperand] = None,
-            each_depth: int = 0,
-        ):
-            nonlocal depth
+        # (item, direction, operand, each_depth, is_exit)
+        stack: List[
+            Tuple[
+                Union[Compositable, None],
+                CompositedDirectionType,
+                Optional[EnumOperand],
+                int,
+                bool,
+            ]
+        ] = [(self, "", None, 0, False)]
+        push = stack.append
+        pop = stack.pop
+
+        while stack:
+            item, direction, operand, each_depth, is_exit = pop()
+            if is_exit:
+                on_finish_wrap(each_depth, item)
+                continue
 
             if not item:
-                return
+                continue
 
             each_depth = abs(each_depth)
-            left = getattr(item, "__left__", None)
-            right = getattr(item, "__right__", None)
-            if not isinstance(item, Composition) and isinstance(item, Compositable):
+            if not _is_composition(item):
                 if operand and direction == "right":
-                    _listener.on_composite(None, operand, direction, each_depth)
+                    on_composite(None, operand, direction, each_depth)
 
-                _listener.on_composite(item, None, direction, each_depth)
-                return None
+                on_composite(item, None, direction, each_depth)
+                continue
 
+            left = item.__left__
+            right = item.__right__
+            item_operand = item.__operand__
             if direction == "right":
-                _listener.on_composite(None, operand, direction, each_depth)
+                on_composite(None, operand, direction, each_depth)
 
-            left_depth = depth - int(isinstance(left, Composition))
-            right_depth = depth - int(isinstance(right, Composition))
+            left_depth = depth - int(_is_composition(left))
+            right_depth = depth - int(_is_composition(right))
             depth -= 1
 
-            _listener.on_begin_wrap(each_depth, item)
-            _traverse(left, "left", item.operand, left_depth)
-            _traverse(right, "right", item.operand, right_depth)
-            _listener.on_finish_wrap(each_depth, item)
-
-        _traverse(self)
+            on_begin_wrap(each_depth, item)
+            # pushed in reverse so that left is visited before right
+            push((item, direction, operand, each_depth, True))
+            push((right, "right", item_operand, right_depth, False))
+            push((left, "left", item_operand, left_depth, False))
 
     @property
     def left(self):
@@ -473,12 +663,14 @@ class Composition(
 class Pathable(abc.ABC):
     __is_mixin__ = True
     __allow_mixin_operation__ = True
+    __is_pathable__ = True
     __cloning_attrs__: _CloningAttrsType = frozenset(["__current__", "__backward__", "__forward__"])
 
     __current__: Union[Pathable, None] = None
     __backward__: Union[Pathable, None] = None
     __forward__: Union[Pathable, None] = None
 
+    @_requires_cloneable
     def _clone(self, **kwargs):
         Cloneable.required_cloneable_inheritance(self)
         return super()._clone(**kwargs)  # type: ignore
@@ -505,7 +697,7 @@ class Pathable(abc.ABC):
 
     @classmethod
     def check_pathable(cls, other: Any, direction: PathDirectionType) -> Pathable:
-        if not isinstance(other, Pathable):
+        if not _is_pathable(other):
             raise NotAllowedPathError(f"Cannot compose non-pathable types: {type(other)}({other})")
         return other
 
@@ -543,7 +735,7 @@ class Pathable(abc.ABC):
     @property
     def current_path(self) -> Union[Pathable, None]:
         if self.__current__:
-            assert isinstance(self.__current__, Pathable)
+            assert _is_pathable(self.__current__)
             return self.__current__
 
         assert self.__current__ is None
@@ -552,7 +744,7 @@ class Pathable(abc.ABC):
     @property
     def backward_path(self) -> Union[Pathable, None]:
         if self.__backward__:
-            assert isinstance(self.__backward__, Pathable)
+            assert _is_pathable(self.__backward__)
         else:
             assert self.__backward__ is None
         return self.__backward__
@@ -560,7 +752,7 @@ class Pathable(abc.ABC):
     @property
     def forward_path(self) -> Union[Pathable, None]:
         if self.__forward__:
-            assert isinstance(self.__forward__, Pathable)
+            assert _is_pathable(self.__forward__)
         else:
             assert self.__forward__ is None
         return self.__forward__
@@ -568,6 +760,11 @@ class Pathable(abc.ABC):
 
 _Filterable_T = TypeVar("_Filterable_T")
 
+_NEGATED_LOOKUP: Dict[EnumLookupExpression, EnumLookupExpression] = {
+    _lookup: _lookup | EnumLookupExpression.NOT
+    for _lookup in EnumLookupExpression.allowed_negate_expr()
+}
+
 
 class Filterable(abc.ABC, Generic[_Filterable_T]):
     __is_mixin__ = True
@@ -581,6 +778,7 @@ class Filterable(abc.ABC, Generic[_Filterable_T]):
         obj.__lookup__ = lookup
         return obj.set_value(value)
 
+    @_requires_cloneable
     def _clone(self, **kwargs):
         Cloneable.required_cloneable_inheritance(self)
         return super()._clone(**kwargs)  # type: ignore
@@ -589,6 +787,21 @@ class Filterable(abc.ABC, Generic[_Filterable_T]):
         Valueable.required_valueable_inheritance(self)
         return super().set_value(value)  # type: ignore
 
+    def _with_lookup(
+        self,
+        lookup: EnumLookupExpression,
+        value: Any,
+        *,
+        validator: Optional[Callable[[Any], None]] = None,
+    ) -> Self:
+        # sets the lookup and the value by one clone instead of chaining `set_value`
+        Valueable.required_valueable_inheritance(self)
+        if callable(validator):
+            validator(value)
+        else:
+            self.check_value(value)  # type: ignore
+        return self._clone(attrs={"__lookup__": lookup, "__value__": value})
+
     @property
     def value(self):
         Valueable.required_valueable_inheritance(self)
@@ -599,51 +812,51 @@ class Filterable(abc.ABC, Generic[_Filterable_T]):
         return self.__lookup__
 
     def __invert__(self) -> Self:
-        if not self.__lookup__.can_negate_expr():
+        lookup = _NEGATED_LOOKUP.get(self.__lookup__)
+        if lookup is None:
             raise TypeError(f"Cannot negate {self.__lookup__}")
-        lookup = self.__lookup__ | EnumLookupExpression.NOT
-        return self._clone(attrs={"__lookup__": lookup})
+        return _clone_attr(self, "__lookup__", lookup)
 
     def not_(self) -> Self:
         return self.__invert__()
 
     def exists(self) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.EXISTS})
+        return _clone_attr(self, "__lookup__", EnumLookupExpression.EXISTS)
 
     def equal(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.EQUAL}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.EQUAL, other)
 
     def __lt__(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.LT}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.LT, other)
 
     lt = __lt__
 
     def __le__(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.LE}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.LE, other)
 
     le = __le__
 
     def __gt__(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.GT}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.GT, other)
 
     gt = __gt__
 
     def __ge__(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.GE}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.GE, other)
 
     ge = __ge__
 
     def like(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.LIKE}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.LIKE, other)
 
     def ilike(self, other: _Filterable_T) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.ILIKE}).set_value(other)
+        return self._with_lookup(EnumLookupExpression.ILIKE, other)
 
     def in_(
         self, other: Union[_Filterable_T | Union[List[_Filterable_T], Tuple[_Filterable_T, ...]]]
     ) -> Self:
-        return self._clone(attrs={"__lookup__": EnumLookupExpression.IN}).set_value(
-            other, validator=self.__check_value_for_in_expr
+        return self._with_lookup(
+            EnumLookupExpression.IN, other, validator=self.__check_value_for_in_expr
         )
 
     def __check_value_for_in_expr(self, value: Any) -> None:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import Any, ClassVar, FrozenSet
 
 import pydantic
+from pydantic.fields import Undefined
 from pydantic.typing import update_model_forward_refs
 
 from nodeedge.mixins import Cloneable, Pathable
+from nodeedge.types import BaseFilterable
 
 __all__ = ["BaseModel", "BaseNodeModel", "BaseLinkPropertyModel", "Config"]
 
@@ -17,33 +20,100 @@ class Config(pydantic.BaseConfig):
 
     # nodeedge configurations
     node_name = ""
+    # build `from_orm` results without validation, for data which is already valid;
+    # values are only converted to their field types by the `validate` of the type
+    trust_orm = False
+    # build the model fields on first use instead of at class creation
+    defer_build = False
 
 
 class BaseModel(pydantic.BaseModel):
     __config__ = Config
+    # fields which pydantic would assign without any check or validation
+    __plain_setattr_fields__: ClassVar[FrozenSet[str]] = frozenset()
+    # whether the model fields are still waiting for `AbstractModel.__build__`
+    __build_pending__: ClassVar[bool] = False
+    __field_names__: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the names are interned so that attribute names match them by identity
+        cls.__field_names__ = frozenset(sys.intern(_name) for _name in cls.__fields__)
+
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        if __pydantic_self__.__build_pending__:
+            type(__pydantic_self__).__build__()
+        super().__init__(**data)
 
     def __setattr__(self, name, value):
-        if name not in self.__fields__:
+        if name in self.__plain_setattr_fields__:
+            self.__dict__[name] = value
+            self.__fields_set__.add(name)
+        # dunder names such as `__current__` are never model fields
+        elif name[:2] == "__" or name not in self.__field_names__:
             # prevent pydantic from setting attribute as a model field
             object.__setattr__(self, name, value)
         else:
             super().__setattr__(name, value)
 
+    @classmethod
+    def validate(cls, value: Any):
+        if cls.__build_pending__:
+            cls.__build__()
+        return super().validate(value)
+
+    @classmethod
+    def construct(cls, _fields_set=None, **values: Any):
+        if cls.__build_pending__:
+            cls.__build__()
+        return super().construct(_fields_set, **values)
+
     @classmethod
     def update_forward_refs(cls, **localns: Any) -> None:
+        if cls.__build_pending__:
+            cls.__build__()
         update_model_forward_refs(
             cls,
             cls.__fields__.values(),
             cls.__config__.json_encoders,
             localns,
         )
+        for _field in cls.__fields__.values():
+            # only nodeedge fields carry a nodeedge field info to resolve
+            resolve = getattr(_field, "resolve_deferred_field_info", None)
+            if resolve is not None:
+                resolve()
 
     @classmethod
     def from_orm(cls, obj: Any):
-        return super().from_orm(obj)
+        if cls.__build_pending__:
+            cls.__build__()
+        config = cls.__config__
+        if not config.trust_orm or not config.orm_mode:
+            return super().from_orm(obj)
+
+        values = {}
+        for name, _field in cls.__fields__.items():
+            value = getattr(obj, _field.alias, Undefined)
+            if value is Undefined:
+                continue
+            # values are wrapped in their field type, without the validator chain of pydantic
+            field_type = _field.type_
+            if (
+                value is not None
+                and isinstance(field_type, type)
+                and issubclass(field_type, BaseFilterable)
+                and not isinstance(value, field_type)
+            ):
+                value = field_type.validate(value)
+            values[name] = value
+        return cls.construct(**values)
 
 
 class BaseNodeModel(Pathable, Cloneable, BaseModel):
+    # field values of a clone are already validated
+    __cloning_constructor__ = "construct"
+
     @classmethod
     def get_node_name(cls) -> str:
         if not cls.__config__.node_name:
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import dataclasses
 import json
 import uuid
-from types import EllipsisType
-from typing import TypeVar, Generic, Union, Type, Any, Sequence, cast
+from operator import attrgetter
+from types import EllipsisType, FunctionType
+from typing import TypeVar, Generic, Union, Type, Any, Sequence, cast, NamedTuple
 
 from typing_extensions import Self, TYPE_CHECKING, TypeAlias
 from edgedb import Object as EdgeDBObject
@@ -85,14 +85,26 @@ class BaseField(BaseFilterable, PythonValueFieldMixin, DbValueFieldMixin):
 
     __allow_mixin_operation__ = False
 
+    # `_db_field_type`, or the db type mapped to the name of each class, resolved at class creation
+    __db_type__ = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__db_type__ = cls._db_field_type or getattr(cls._field_type_map, cls.__name__, None)
+
     @classmethod
     def validate(cls, *args, **kwargs):
         return cls(*args, **kwargs)
 
     @classmethod
     def get_validators(cls):
-        for validator in cls.__get_validators__():
-            yield validator
+        # the validator chain of a field type never changes, so it is collected once per class;
+        # constrained field types fill the same cache from `__get_validators__`
+        validators = cls.__dict__.get("__cached_validators__")
+        if validators is None:
+            validators = tuple(cls.__get_validators__())
+            cls.__cached_validators__ = validators
+        return iter(validators)
 
     @classmethod
     def __get_validators__(cls):
@@ -104,7 +116,8 @@ class BaseField(BaseFilterable, PythonValueFieldMixin, DbValueFieldMixin):
 
     @classmethod
     def as_db_type(cls):
-        return cls._db_field_type or getattr(cls._field_type_map, cls.__name__)
+        # an unmapped class raises `AttributeError` by the lookup
+        return cls.__db_type__ or getattr(cls._field_type_map, cls.__name__)
 
     def as_jsonable_value(self):
         if self._python_value is ...:
@@ -120,38 +133,54 @@ class BaseListField(Generic[Listable_T]):
 
     def __init__(self, value):
         self._data = value
+        # bind the common sequence methods up front so they never reach `__getattr__`
+        if isinstance(value, list):
+            self.append = value.append
+            self.extend = value.extend
+        if isinstance(value, (list, tuple)):
+            self.index = value.index
+            self.count = value.count
 
     def __iter__(self):
-        return self.data.__iter__()
+        return iter(self._data)
 
     def __getattr__(self, name: str):
         return getattr(self.data, name)
 
     def __getitem__(self, key):
-        return self.data[key]
+        return self._data[key]
 
     def __len__(self):
-        return len(self.data)
+        return len(self._data)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.data.__repr__()})"
+        return f"{self.__class__.__name__}({self._data.__repr__()})"
 
-    @property
-    def data(self):
-        return self._data
+    data = property(attrgetter("_data"))
 
     def as_jsonable_value(self):
-        return [v.as_python_value() if hasattr(v, "as_python_value") else v for v in self.data]
+        return _map_values(self._data, "as_python_value")
 
     def as_db_value(self):
-        return [v.as_db_value() if hasattr(v, "as_db_value") else v for v in self.data]
+        return _map_values(self._data, "as_db_value")
+
+
+def _map_values(data: Sequence, method_name: str) -> list:
+    if isinstance(data, (list, tuple)) and data:
+        # most lists hold a single field type, whose method is resolved once for all items
+        item_type = type(data[0])
+        method = getattr(item_type, method_name, None)
+        if type(method) is FunctionType and all(type(v) is item_type for v in data):
+            return [method(v) for v in data]
+
+    return [getattr(v, method_name)() if hasattr(v, method_name) else v for v in data]
 
 
 class BaseUUIDField(BaseField, PythonValueFieldMixin[uuid.UUID], DbValueFieldMixin[str]):
     @classmethod
     def validate(cls: Type, value: str | uuid.UUID):
         if isinstance(value, uuid.UUID):
-            result = cls(value.hex)
+            result = cls(int=value.int)
         else:
             result = cls(value)
 
@@ -161,7 +190,12 @@ class BaseUUIDField(BaseField, PythonValueFieldMixin[uuid.UUID], DbValueFieldMix
         return self
 
     def as_db_value(self):
-        return str(self.as_python_value())
+        db_value = self._db_value
+        if db_value is ...:
+            db_value = str(self.as_python_value())
+            # `uuid.UUID` forbids setting attributes
+            object.__setattr__(self, "_db_value", db_value)
+        return db_value
 
     def as_jsonable_value(self):
         return self.as_db_value()
@@ -182,9 +216,11 @@ class BaseLinkField(DbValueFieldMixin, Generic[Link_T, LinkProperty_T]):
         return f"{self.__class__.__name__})"
 
     def __getattr__(self, attr: str):
-        data = self._db_value
-        if hasattr(data, attr):
-            return getattr(data, attr)
+        # a single lookup instead of `hasattr()` followed by `getattr()`;
+        # edgedb objects resolve their shape fields dynamically, so no name list is cached
+        value = getattr(self._db_value, attr, _MISSING)
+        if value is not _MISSING:
+            return value
 
         return super().__getattribute__(attr)
 
@@ -194,11 +230,7 @@ class BaseLinkField(DbValueFieldMixin, Generic[Link_T, LinkProperty_T]):
     ) -> Union[
         Self, BaseNodeModel, uuid.UUID, tuple[BaseNodeModel, Union[BaseLinkPropertyModel, None]]
     ]:
-        if isinstance(value, cls):
-            return value
-        elif isinstance(value, BaseNodeModel):
-            return value
-        elif isinstance(value, uuid.UUID):
+        if type(value) is uuid.UUID or isinstance(value, (cls, BaseNodeModel, uuid.UUID)):
             return value
         elif isinstance(value, DBRawObject):
             return value.id
@@ -215,14 +247,16 @@ class BaseLinkField(DbValueFieldMixin, Generic[Link_T, LinkProperty_T]):
         return json.dumps(self.as_db_value())
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class NodeEdgeFieldInfo:
+_MISSING = object()
+
+
+class NodeEdgeFieldInfo(NamedTuple):
     model: Type[BaseNodeModel]
     deferred: bool
-    is_single_link: bool = dataclasses.field(default=False)
-    is_multi_link: bool = dataclasses.field(default=False)
-    link_model: Union[Type[BaseNodeModel], None] = dataclasses.field(default=None)
-    link_property_model: Union[Type[BaseLinkPropertyModel], None] = dataclasses.field(default=None)
+    is_single_link: bool = False
+    is_multi_link: bool = False
+    link_model: Union[Type[BaseNodeModel], None] = None
+    link_property_model: Union[Type[BaseLinkPropertyModel], None] = None
 
     @property
     def is_link(self):
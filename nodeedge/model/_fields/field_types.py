@@ -5,12 +5,17 @@ import json
 import re
 from typing import (
     Any,
+    Callable,
+    Mapping,
     Union,
     Optional,
+    Type,
     TypeVar,
     cast,
 )
 from decimal import Decimal as _Decimal
+from functools import lru_cache
+from types import MappingProxyType
 
 from edgedb import DateDuration as _DateDuration
 from edgedb import RelativeDuration as _RelativeDuration
@@ -56,6 +61,7 @@ from .base_fields import (
     BaseListField,
     PythonValueFieldMixin,
     BaseUUIDField,
+    Listable_T,
 )
 
 
@@ -89,127 +95,118 @@ __all__ = [
 ]
 
 
+class _ConstrainedValidatorsMixin:
+    """pydantic constrained type의 validator 뒤에 `validate`를 붙인 chain을 class마다 한 번만 만듭니다."""
+
+    @classmethod
+    def __get_validators__(cls):
+        validators = cls.__dict__.get("__cached_validators__")
+        if validators is None:
+            validators = (*super().__get_validators__(), cls.validate)  # type: ignore[misc]
+            cls.__cached_validators__ = validators
+        yield from validators
+
+
+# the constrained types' own `validate`, called without building a `super()` object per call
+_validate_constr_str = ConstrainedStr.validate.__func__  # type: ignore[attr-defined]
+_validate_constr_decimal = ConstrainedDecimal.validate.__func__  # type: ignore[attr-defined]
+
+
 class Str(ConstrainedStr, BaseField):
     @classmethod
     def validate(cls, value: str) -> Self:
-        result = cls(super().validate(value))
-        result._python_value = str(result)
+        value = _validate_constr_str(cls, value)
+        result = cls(value)
+        result._python_value = value if type(value) is str else str(result)
         return result
 
 
-class Int16(ConstrainedInt, BaseField):
+class Int16(_ConstrainedValidatorsMixin, ConstrainedInt, BaseField):
     ge = -32_768
     le = 32_767
 
-    @classmethod
-    def __get_validators__(cls):
-        for validator in super().__get_validators__():
-            yield validator
-        yield cls.validate
-
     @classmethod
     def validate(cls, value: int) -> Self:
         result = cls(value)
-        result._python_value = int(result)
+        result._python_value = value if type(value) is int else int(result)
         return result
 
 
-class Int32(ConstrainedInt, BaseField):
+class Int32(_ConstrainedValidatorsMixin, ConstrainedInt, BaseField):
     ge = -2_147_483_648
     le = 2_147_483_647
 
-    @classmethod
-    def __get_validators__(cls):
-        for validator in super().__get_validators__():
-            yield validator
-        yield cls.validate
-
     @classmethod
     def validate(cls, value: int) -> Self:
         result = cls(value)
-        result._python_value = int(result)
+        result._python_value = value if type(value) is int else int(result)
         return result
 
 
-class Int64(ConstrainedInt, BaseField):
+class Int64(_ConstrainedValidatorsMixin, ConstrainedInt, BaseField):
     ge = -9_223_372_036_854_775_808
     le = 9_223_372_036_854_775_807
 
-    @classmethod
-    def __get_validators__(cls):
-        for validator in super().__get_validators__():
-            yield validator
-        yield cls.validate
-
     @classmethod
     def validate(cls, value: int) -> Self:
         result = cls(value)
-        result._python_value = int(result)
+        result._python_value = value if type(value) is int else int(result)
         return result
 
 
+_BIGINT_RE = re.compile(r"((?P<value>[0-9]+)(e\+(?P<exponent>[0-9]+))?)n")
+
+
 class BigInt(ConstrainedStr, BaseField):
-    regex = re.compile(r"((?P<value>[0-9]+)(e\+(?P<exponent>[0-9]+))?)n")
+    regex = _BIGINT_RE
 
     @classmethod
     def validate(cls, value: str) -> Self:
-        matched = cls.regex.fullmatch(value)
+        # `ConstrainedStr.validate` would only match `regex` once more
+        matched = _BIGINT_RE.fullmatch(value)
         if not matched:
             raise ValueError("invalid BigInt format")
 
-        matched_dict = matched.groupdict()
-        converted: dict[str, int]
-        if not any(matched_dict.values()):
-            converted = {"value": 0, "exponent": 0}
-        else:
-            converted = {_k: int(_v) if _v else 0 for _k, _v in matched_dict.items()}
+        python_value = int(matched["value"])
+        exponent = matched["exponent"]
+        if exponent:
+            # integer arithmetic keeps every digit, unlike a round trip through `float`
+            python_value *= 10 ** int(exponent)
 
-        result = cls(super().validate(value))
-        result._python_value = int(float(f"{converted['value']}e{converted['exponent']}"))
+        result = cls(value)
+        result._python_value = python_value
         return result
 
     def as_jsonable_value(self):
         return json.dumps(self)
 
 
-class Float32(ConstrainedFloat, BaseField):
+class Float32(_ConstrainedValidatorsMixin, ConstrainedFloat, BaseField):
     ge = -3.4e38
     le = 3.4e38
 
-    @classmethod
-    def __get_validators__(cls):
-        for validator in super().__get_validators__():
-            yield validator
-        yield cls.validate
-
     @classmethod
     def validate(cls, value: float) -> Self:
         result = cls(value)
-        result._python_value = float(result)
+        result._python_value = value if type(value) is float else float(result)
         return result
 
 
-class Float64(ConstrainedFloat, BaseField):
+class Float64(_ConstrainedValidatorsMixin, ConstrainedFloat, BaseField):
     ge = -1.7e308
     le = 1.7e308
 
-    @classmethod
-    def __get_validators__(cls):
-        for validator in super().__get_validators__():
-            yield validator
-        yield cls.validate
-
     @classmethod
     def validate(cls, value: float) -> Self:
         result = cls(value)
-        result._python_value = float(result)
+        result._python_value = value if type(value) is float else float(result)
         return result
 
 
 class Decimal(ConstrainedDecimal, BaseField):
     @classmethod
     def validate(cls, value: _Decimal | int | str) -> Self:
-        result = cls(super().validate(cast(_Decimal, value)))
+        result = cls(_validate_constr_decimal(cls, cast(_Decimal, value)))
         result._python_value = result
         return result
 
@@ -228,6 +225,11 @@ class Bool(int, BaseField):
 
     @classmethod
     def validate(cls, value: Any) -> Self:
+        if value is True or value is False:
+            result = cls(value)
+            result._python_value = value
+            return result
+
         result = cls(bool_validator(value))
         result._python_value = True if result else False
         return result
@@ -298,12 +300,38 @@ class Time(datetime.time, _IsoFormatField, BaseField, metaclass=ConstrainedNumbe
         return cls.validate(datetime.datetime.utcnow().time())
 
 
-class NaiveDateTime(datetime.datetime, _IsoFormatField, BaseField, metaclass=ConstrainedNumberMeta):
+_DateTime_T = TypeVar("_DateTime_T", bound=datetime.datetime)
+
+
+def _to_datetime_field(cls: Type[_DateTime_T], value: datetime.datetime) -> _DateTime_T:
+    if type(value) is datetime.datetime:
+        # the pickle state of a plain datetime rebuilds it about twice as fast as its fields do
+        return datetime.datetime.__new__(cls, *value.__reduce_ex__(4)[1])
+    return cls(
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond,
+        value.tzinfo,
+        fold=value.fold,
+    )
+
+
+class _BaseDateTimeField(
+    datetime.datetime, _IsoFormatField, BaseField, metaclass=ConstrainedNumberMeta
+):
     gt: Optional[datetime.datetime] = None
     ge: Optional[datetime.datetime] = None
     lt: Optional[datetime.datetime] = None
     le: Optional[datetime.datetime] = None
 
+    # values for which this check holds are rejected with `__invalid_tz_message__`
+    __invalid_tz__: Callable[[datetime.datetime], bool]
+    __invalid_tz_message__: str
+
     @classmethod
     def __modify_schema__(cls, field_schema: dict[str, Any]) -> None:
         update_not_none(
@@ -324,68 +352,25 @@ class NaiveDateTime(datetime.datetime, _IsoFormatField, BaseField, metaclass=Con
     def validate(cls, value: Union[datetime.datetime, StrBytesIntFloat]) -> Self:
         if not isinstance(value, datetime.datetime):
             value = parse_datetime(value)
-        if is_aware(value):
-            raise ValueError("datetime is off-set awarded")
-        result = cls(
-            value.year,
-            value.month,
-            value.day,
-            value.hour,
-            value.minute,
-            value.second,
-            value.microsecond,
-            value.tzinfo,
-            fold=value.fold,
-        )
+        if cls.__invalid_tz__(value):
+            raise ValueError(cls.__invalid_tz_message__)
+        result = _to_datetime_field(cls, value)
         result._python_value = value
         return result
 
-    @classmethod
-    def now(cls, tz: Optional[datetime.tzinfo] = None) -> Self:
-        return cls.validate(make_naive(datetime.datetime.now(tz)))
-
 
-class AwareDateTime(datetime.datetime, _IsoFormatField, BaseField, metaclass=ConstrainedNumberMeta):
-    gt: Optional[datetime.datetime] = None
-    ge: Optional[datetime.datetime] = None
-    lt: Optional[datetime.datetime] = None
-    le: Optional[datetime.datetime] = None
+class NaiveDateTime(_BaseDateTimeField):
+    __invalid_tz__ = staticmethod(is_aware)
+    __invalid_tz_message__ = "datetime is off-set awarded"
 
     @classmethod
-    def __modify_schema__(cls, field_schema: dict[str, Any]) -> None:
-        update_not_none(
-            field_schema,
-            exclusiveMinimum=cls.gt,
-            exclusiveMaximum=cls.lt,
-            minimum=cls.ge,
-            maximum=cls.le,
-        )
+    def now(cls, tz: Optional[datetime.tzinfo] = None) -> Self:
+        return cls.validate(make_naive(datetime.datetime.now(tz)))
 
-    @classmethod
-    def __get_validators__(cls):
-        yield parse_datetime
-        yield number_size_validator
-        yield cls.validate
 
-    @classmethod
-    def validate(cls, value: Union[datetime.datetime, StrBytesIntFloat]) -> Self:
-        if not isinstance(value, datetime.datetime):
-            value = parse_datetime(value)
-        if is_naive(value):
-            raise ValueError("datetime is not off-set awarded")
-        result = cls(
-            value.year,
-            value.month,
-            value.day,
-            value.hour,
-            value.minute,
-            value.second,
-            value.microsecond,
-            value.tzinfo,
-            fold=value.fold,
-        )
-        result._python_value = value
-        return result
+class AwareDateTime(_BaseDateTimeField):
+    __invalid_tz__ = staticmethod(is_naive)
+    __invalid_tz_message__ = "datetime is not off-set awarded"
 
     @classmethod
     def now(cls, tz: Optional[datetime.tzinfo] = None) -> Self:
@@ -394,6 +379,7 @@ class AwareDateTime(datetime.datetime, _IsoFormatField, BaseField, metaclass=Con
 
 _SECS_PER_MINUTE = 60
 _SECS_PER_HOUR = 3600
+_SECS_PER_DAY = 86400
 
 
 class Duration(datetime.timedelta, BaseField):
@@ -415,18 +401,16 @@ class Duration(datetime.timedelta, BaseField):
 
     def format_duration(self) -> str:
         value = self.as_python_value()
-        total_seconds = value.total_seconds()
+        hour, seconds = divmod(value.days * _SECS_PER_DAY + value.seconds, _SECS_PER_HOUR)
+        minute, seconds = divmod(seconds, _SECS_PER_MINUTE)
 
         time_parts = []
-        if hour := (total_seconds // _SECS_PER_HOUR):
-            time_parts.append(f"{int(hour)} hours")
-            total_seconds -= hour * _SECS_PER_HOUR
-        if minute := (total_seconds // _SECS_PER_MINUTE):
-            time_parts.append(f"{int(minute)} minutes")
-            total_seconds -= minute * _SECS_PER_MINUTE
-
-        if total_seconds:
-            time_parts.append(f"{int(total_seconds)} seconds")
+        if hour:
+            time_parts.append(f"{hour} hours")
+        if minute:
+            time_parts.append(f"{minute} minutes")
+        if seconds:
+            time_parts.append(f"{seconds} seconds")
 
         if value.microseconds:
             time_parts.append(f"{value.microseconds} microseconds")
@@ -434,6 +418,18 @@ class Duration(datetime.timedelta, BaseField):
         return " ".join(time_parts)
 
 
+# the same duration strings are validated over and over, so the parsed units are cached
+# as read-only mappings which every caller shares
+@lru_cache(maxsize=1024)
+def _parse_relative_duration(value: str) -> Mapping[str, Any]:
+    return MappingProxyType(parse_relative_duration(value))
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_duration(value: str) -> Mapping[str, Any]:
+    return MappingProxyType(parse_date_duration(value))
+
+
 class RelativeDuration(ConstrainedStr, BaseField):
     _edgedb_value: _RelativeDuration
     months: int
@@ -447,7 +443,7 @@ class RelativeDuration(ConstrainedStr, BaseField):
     @classmethod
     def validate(cls, value: str) -> Self:
         result = cls(value)
-        parsed = parse_relative_duration(value)
+        parsed = _parse_relative_duration(value)
         result.months = parsed["months"] or 0
         result.days = parsed["days"] or 0
         result.microseconds = parsed["microseconds"] or 0
@@ -467,7 +463,7 @@ class DateDuration(ConstrainedStr, BaseField):
     @classmethod
     def validate(cls, value: str) -> Self:
         result = cls(value)
-        parsed = parse_date_duration(value)
+        parsed = _parse_date_duration(value)
         result.months = parsed["months"] or 0
         result.days = parsed["days"] or 0
         result._db_value = _DateDuration(**parsed)
@@ -518,13 +514,7 @@ class UUID5(_UUID5, BaseUUIDField):
         yield cls.validate
 
 
-class Bytes(ConstrainedBytes, BaseField):
-    @classmethod
-    def __get_validators__(cls):
-        for validator in super().__get_validators__():
-            yield validator
-        yield cls.validate
-
+class Bytes(_ConstrainedValidatorsMixin, ConstrainedBytes, BaseField):
     @classmethod
     def validate(cls, value: Any) -> Self:
         result = cls(value)
@@ -534,9 +524,6 @@ class Bytes(ConstrainedBytes, BaseField):
         return self.decode()
 
 
-Listable_T = TypeVar("Listable_T")
-
-
 class Array(BaseListField[Listable_T], BaseField):
     _data: list[Listable_T]
 
@@ -584,6 +571,8 @@ class Tuple(BaseListField[Listable_T], BaseField):
 
     @classmethod
     def validate(cls, value: Any) -> Self:
+        if type(value) is cls:
+            return value
         if isinstance(value, Tuple):
             target = value.data
         else:
@@ -611,6 +600,8 @@ class NamedTuple(BaseListField[Listable_T], BaseField):
 
     @classmethod
     def validate(cls, value: Any) -> Self:
+        if type(value) is cls:
+            return value
         if isinstance(value, NamedTuple):
             target = value.data
         else:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import uuid
-from functools import lru_cache
 from typing import List, Any, Union, cast, Optional
 
 from pydantic.validators import list_validator
@@ -30,6 +29,10 @@ __all__ = [
 LinkDataType: TypeAlias = Union[BaseNodeModel, uuid.UUID, DBRawObjectType]
 LinkPropertyDataType: TypeAlias = Union[BaseLinkPropertyModel, None]
 
+_LINK_DATA_TYPES = (BaseNodeModel, uuid.UUID, DBRawObject)
+_LINK_PAIR_TYPES = (list, tuple)
+_BARE_LINK_DATA_TYPES = (BaseNodeModel, uuid.UUID)
+
 
 class Link(BaseLinkField[Link_T, LinkProperty_T], BaseField):
     _db_value: Union[Link_T, uuid.UUID]
@@ -55,11 +58,9 @@ class Link(BaseLinkField[Link_T, LinkProperty_T], BaseField):
     def is_id_link(self):
         return isinstance(self._db_value, uuid.UUID)
 
-    @lru_cache
     def get_link_data(self) -> Link_T | uuid.UUID:
         return self._db_value
 
-    @lru_cache
     def get_link_property(self) -> LinkProperty_T | None:
         return self._link_property
 
@@ -72,7 +73,7 @@ class Link(BaseLinkField[Link_T, LinkProperty_T], BaseField):
     def validate(cls, value: Any) -> Self:
         link_data: LinkDataType
         link_property: LinkPropertyDataType = None
-        if isinstance(value, (list, tuple)):
+        if isinstance(value, _LINK_PAIR_TYPES):
             if len(value) != 2:
                 raise ValueError(
                     "invalid Link value: must be a tuple of (link_data, link_property)"
@@ -82,7 +83,7 @@ class Link(BaseLinkField[Link_T, LinkProperty_T], BaseField):
         else:
             link_data = value
 
-        if not isinstance(link_data, (BaseNodeModel, uuid.UUID, DBRawObject)):
+        if not isinstance(link_data, _LINK_DATA_TYPES):
             raise ValueError(f"invalid Link value type: {type(link_data)}")
 
         if link_property and not isinstance(link_property, BaseLinkPropertyModel):
@@ -100,7 +101,8 @@ class MultiLink(
     _db_value: List[Link[Link_T, LinkProperty_T]]
 
     def __init__(self, value: List):
-        _db_value: List[Link] = [Link.validate(v) for v in value]
+        # items coming through `validate_each` are `Link`s already
+        _db_value: List[Link] = [v if type(v) is Link else Link.validate(v) for v in value]
         self._db_value = _db_value
         super().__init__(_db_value)
 
@@ -120,9 +122,17 @@ class MultiLink(
 
     @classmethod
     def validate_each(cls, value: Any):
+        check_args = Link.check_args
+        validate = Link.validate
+        links = []
         for item in value:
-            Link.check_args(item)
-        return value
+            if isinstance(item, _BARE_LINK_DATA_TYPES):
+                # a bare node or id needs none of the checks on link property pairs
+                links.append(Link(item))
+                continue
+            check_args(item)
+            links.append(validate(item))
+        return links
 
     @classmethod
     def validate(cls, value: Any) -> Self:
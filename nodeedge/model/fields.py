@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Type, ForwardRef, Union, cast, Iterable
+import copy
+from typing import Any, Type, ForwardRef, Union, cast
 
 import pydantic
 from pydantic import Field as _PydanticField
@@ -9,7 +10,6 @@ from pydantic.fields import (
     ModelField as _PydanticModelField,
     FieldInfo as _PydanticFieldInfo,
 )
-from pydantic.utils import smart_deepcopy
 
 from nodeedge.utils import logger
 from . import BaseNodeModel, BaseLinkPropertyModel
@@ -112,6 +112,12 @@ def field(default: Any = Undefined, **kwargs) -> FieldInfo:
     return field_info
 
 
+_FIELD_INFO_ATTRS = _PydanticFieldInfo.__slots__
+_FIELD_INFO_CONSTRAINTS = _PydanticFieldInfo.__field_constraints__
+# values which pydantic leaves out of `FieldInfo.__repr_args__()`
+_FIELD_INFO_REPR_DEFAULTS = {"repr": True, **_FIELD_INFO_CONSTRAINTS}
+
+
 def nodeedge_field_info_from_field(model: Type[BaseNodeModel], _field: pydantic.fields.ModelField):
     if isinstance(_field.type_, ForwardRef):
         return NodeEdgeFieldInfo(
@@ -149,10 +155,26 @@ def nodeedge_field_info_from_field(model: Type[BaseNodeModel], _field: pydantic.
     )
 
 
+_FIELD_VALIDATOR_ATTRS = ("validators", "pre_validators", "post_validators")
+
+
+def _copy_model_field(_field: _PydanticModelField) -> _PydanticModelField:
+    """field를 얕게 복사하되 validator와 sub field의 list는 새로 만들어 원본과 나누지 않습니다."""
+    cloned = copy.copy(_field)
+    for name in _FIELD_VALIDATOR_ATTRS:
+        validators = getattr(_field, name)
+        if validators is not None:
+            setattr(cloned, name, list(validators))
+    if _field.sub_fields is not None:
+        cloned.sub_fields = [_copy_model_field(_sub_field) for _sub_field in _field.sub_fields]
+    return cloned
+
+
 class Field(_PydanticModelField, Pathable, Valueable, Cloneable):
     field_info: FieldInfo
 
-    __cloning_operator__ = staticmethod(smart_deepcopy)
+    # `field_info` is a cloning attr, so clones share it with their source
+    __cloning_operator__ = staticmethod(_copy_model_field)
     __cloning_attrs__: _CloningAttrsType = frozenset(["field_info"])
 
     def __init__(self, **kwargs) -> None:
@@ -173,21 +195,30 @@ class Field(_PydanticModelField, Pathable, Valueable, Cloneable):
         super().__init__(field_info=field_info, **kwargs)
 
     def __eq__(self, other: Any):
+        if self is other:
+            return True
         if not isinstance(other, Field):
             return False
 
-        assert isinstance(other, Field)
+        if self.name != other.name or self.type_ != other.type_:
+            return False
 
-        result = self.type_ == other.type_
+        nodeedge = self.field_info.nodeedge
+        other_nodeedge = other.field_info.nodeedge
+        if nodeedge and other_nodeedge and nodeedge.model != other_nodeedge.model:
+            return False
 
-        if self.field_info.nodeedge and other.field_info.nodeedge:
-            assert self.field_info.nodeedge is not None
-            assert other.field_info.nodeedge is not None
-            result &= self.field_info.nodeedge.model == other.field_info.nodeedge.model
+        return bool(self.value == other.value)
 
-        result &= self.name == other.name
-        result &= self.value == other.value
-        return result
+    def resolve_deferred_field_info(self) -> None:
+        """forward reference가 풀린 field의 deferred nodeedge field info를 다시 만듭니다."""
+        nodeedge = self.field_info.nodeedge
+        if nodeedge is None or not nodeedge.deferred or isinstance(self.type_, ForwardRef):
+            return
+        if isinstance(self.annotation, ForwardRef):
+            # pydantic resolves `type_` and `outer_type_` only
+            self.annotation = self.outer_type_
+        self.field_info.extra["nodeedge"] = nodeedge_field_info_from_field(nodeedge.model, self)
 
     @staticmethod
     def substitute_field_info(
@@ -195,7 +226,13 @@ class Field(_PydanticModelField, Pathable, Valueable, Cloneable):
     ) -> FieldInfo:
         field_info = FieldInfo(nodeedge=nodeedge)
         if origin:
-            field_info.update_from_config(dict(cast(Iterable, origin.__repr_args__())))
+            # same as `update_from_config(dict(origin.__repr_args__()))`, without the dict
+            for name in _FIELD_INFO_ATTRS:
+                if getattr(field_info, name) is not _FIELD_INFO_CONSTRAINTS.get(name):
+                    continue
+                value = getattr(origin, name)
+                if value != _FIELD_INFO_REPR_DEFAULTS.get(name):
+                    setattr(field_info, name, value)
 
         return field_info
 
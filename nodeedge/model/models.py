@@ -9,11 +9,11 @@ from pydantic import main as pydantic_main
 from pydantic.typing import resolve_annotations
 
 from nodeedge import GlobalConfiguration
-from nodeedge.mixins import Cloneable
+from nodeedge.mixins import Cloneable, _install_clone_impl
 
 
 from ._base_model import BaseNodeModel, BaseLinkPropertyModel
-from .fields import field, nodeedge_field_info_from_field, Field
+from .fields import field, nodeedge_field_info_from_field, Field, NodeEdgeFieldInfo
 from ._fields.field_types import UUID1
 
 __all__ = [
@@ -27,8 +27,26 @@ from ..types import FieldInfo
 from ..utils.typing import sort_function_parameters
 
 
+class _PendingField:
+    """build가 미뤄진 model의 field 자리에 두었다가 class에서 접근하면 model을 build합니다."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Type[Any]) -> Any:
+        owner.__build__()
+        return owner.__dict__[self.name]
+
+
 class AbstractModel(pydantic_main.ModelMetaclass):
     def __new__(mcs, cls_name: str, bases, namespace, **kwargs):
+        # subclasses copy the fields of their bases, which must be built by then
+        for base in bases:
+            if base.__dict__.get("__build_pending__"):
+                base.__build__()
+
         # noinspection PyTypeChecker
         model_class = super().__new__(mcs, cls_name, bases, namespace=namespace, **kwargs)
 
@@ -36,22 +54,70 @@ class AbstractModel(pydantic_main.ModelMetaclass):
             namespace.get("__annotations__", {}),
             namespace.get("__module__"),
         )
+        model_class.__hints__ = model_class.__annotations__ = hints
 
-        for name, value in hints.items():
-            _field: pydantic.fields.ModelField = model_class.__fields__[name]
-            nodeedge_field_info = nodeedge_field_info_from_field(model_class, _field)
-            field_params = create_field_params(name, _field)
-            field_params["field_info"] = FieldInfo(nodeedge=nodeedge_field_info)
+        model_class.__build_pending__ = True
+        if not model_class.__config__.defer_build:
+            model_class.__build__()
+        else:
+            for name in model_class.__fields__:
+                setattr(model_class, name, _PendingField(name))
 
-            model_class.__fields__[name] = Field(**field_params)
+        for _mro in model_class.__mro__:
+            if not getattr(_mro, "__is_mixin__", False):
+                continue
+            for k, v in _mro.__dict__.items():
+                if k.startswith("__"):
+                    continue
+                setattr(model_class, k, v)
 
-        for k, f in model_class.__fields__.items():
-            setattr(model_class, k, f)
+            # if Cloneable in model_class.__mro__:
+            if _mro is Cloneable:
+                model_class.__init_kwargs__ = model_class.__field_names__
+                _install_clone_impl(model_class)
+        return model_class
 
-        model_class.__hints__ = hints
-        model_class.__annotations__ = hints
+    def __build__(cls) -> None:
+        """model field를 nodeedge `Field`로 만듭니다. `Config.defer_build`이면 처음 사용할 때 호출됩니다."""
+        if not cls.__dict__.get("__build_pending__"):
+            return
+        cls.__build_pending__ = False
+
+        # fields with equal info, e.g. every plain field of the model, share one instance
+        field_infos: Dict[NodeEdgeFieldInfo, NodeEdgeFieldInfo] = {}
+        for name in cls.__hints__:
+            _field: pydantic.fields.ModelField = cls.__fields__[name]
+            nodeedge_field_info = nodeedge_field_info_from_field(cls, _field)
+            nodeedge_field_info = field_infos.setdefault(nodeedge_field_info, nodeedge_field_info)
+            cls.__fields__[name] = Field(
+                type_=_field.type_,
+                class_validators=_field.class_validators,
+                model_config=_field.model_config,
+                default=_field.default,
+                default_factory=_field.default_factory,
+                final=_field.final,
+                alias=_field.alias,
+                field_info=FieldInfo(nodeedge=nodeedge_field_info),
+                name=name,
+                required=_field.required,
+            )
 
-        sig = inspect.signature(model_class.__init__)
+        for name, _field in cls.__fields__.items():
+            # mixin attributes copied over the placeholders of a deferred build take precedence
+            if name not in cls.__dict__ or isinstance(cls.__dict__[name], _PendingField):
+                setattr(cls, name, _field)
+
+        config = cls.__config__
+        cls.__plain_setattr_fields__ = frozenset(
+            _name
+            for _name, _field in cls.__fields__.items()
+            if config.allow_mutation
+            and not config.frozen
+            and not config.validate_assignment
+            and not _field.final
+        )
+
+        sig = inspect.signature(cls.__init__)
 
         init_params: dict = defaultdict(list)
 
@@ -62,46 +128,16 @@ class AbstractModel(pydantic_main.ModelMetaclass):
                 kind=inspect.Parameter.KEYWORD_ONLY,
                 default=_field.field_info,
             )
-            for _name, _field in model_class.__fields__.items()
+            for _name, _field in cls.__fields__.items()
             if _name not in sig.parameters
         ]
         for param in sig.parameters.values():
             init_params[param.kind].append(param)
 
-        model_class.__init__.__signature__ = sig.replace(
+        cls.__init__.__signature__ = sig.replace(
             parameters=sort_function_parameters(init_params),
         )
 
-        for _mro in model_class.__mro__:
-            if not getattr(_mro, "__is_mixin__", False):
-                continue
-            for k, v in _mro.__dict__.items():
-                if k.startswith("__"):
-                    continue
-                setattr(model_class, k, v)
-
-            # if Cloneable in model_class.__mro__:
-            if _mro is Cloneable:
-                model_class.__init_kwargs__ = frozenset(model_class.__fields__.keys())
-        return model_class
-
-
-def create_field_params(name: str, _field: pydantic.fields.ModelField) -> Dict:
-    field_type = _field.type_
-
-    return {
-        "type_": field_type,
-        "class_validators": _field.class_validators,
-        "model_config": _field.model_config,
-        "default": _field.default,
-        "default_factory": _field.default_factory,
-        "final": _field.final,
-        "alias": _field.alias,
-        "field_info": _field.field_info,
-        "name": name,
-        "required": _field.required,
-    }
-
 
 if GlobalConfiguration.is_edgedb_backend():
 
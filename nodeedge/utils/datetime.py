@@ -136,33 +136,26 @@ def format_relative_duration(months: int = 0, days: int = 0, microseconds: int =
     if not months and not days and not microseconds:
         return "PT0S"
 
-    date_part = format_date_duration(months=months, days=days, only_body=True)
+    date_part = format_date_duration(months, days, only_body=True) if months or days else ""
 
     is_negative = microseconds < 0
 
-    microseconds = abs(microseconds)
-    units = []
-    if hour := (microseconds // _USECS_PER_HOUR):
-        units.append(f"{int(hour)}H")
-        microseconds -= hour * _USECS_PER_HOUR
-    if minute := (microseconds // _USECS_PER_MINUTE):
-        units.append(f"{int(minute)}M")
-        microseconds -= minute * _USECS_PER_MINUTE
-
-    second = int(microseconds // _USECS_PER_SEC)
-    microseconds = microseconds % _USECS_PER_SEC
+    hour, microseconds = divmod(abs(microseconds), _USECS_PER_HOUR)
+    minute, microseconds = divmod(microseconds, _USECS_PER_MINUTE)
+    second, microseconds = divmod(microseconds, _USECS_PER_SEC)
 
     if is_negative:
         second = -second
 
+    time_part = f"{hour}H" if hour else ""
+    if minute:
+        time_part += f"{minute}M"
     if microseconds:
-        units.append(f"{second}.{microseconds}")
+        time_part += f"{second}.{microseconds}"
     else:
-        units.append(str(second))
-
-    units = "".join(units)
+        time_part += str(second)
 
-    return f"P{date_part}T{units}S"
+    return f"P{date_part}T{time_part}S"
 
 
 class DateDurationUnit(TypedDict):
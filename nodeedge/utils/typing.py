@@ -45,11 +45,7 @@ def is_subclass(obj: Any, target: Union[Type, Tuple[Type, ...]]):
 
     assert isinstance(type(obj), type)
 
-    try:
-        assert issubclass(obj, target)
-        return True
-    except AssertionError:
-        return False
+    return issubclass(obj, target)
 
 
 def annotate_from(fn):
@@ -1,3 +1,4 @@
+from nodeedge import GlobalConfiguration
 from nodeedge.backends import BackendLoader
 from nodeedge.backends.base import FieldTypeMap
 from nodeedge.model import fields
@@ -10,3 +11,11 @@ def test_backend_loader(global_configuration):
 
     field = fields.Str("hello world")
     assert isinstance(field._field_type_map, FieldTypeMap)
+
+
+def test_is_edgedb_backend_follows_backend(monkeypatch):
+    with monkeypatch.context() as ctx:
+        ctx.setattr(GlobalConfiguration, "BACKEND", "nodeedge.backends.other")
+        assert not GlobalConfiguration.is_edgedb_backend()
+
+    assert GlobalConfiguration.is_edgedb_backend() == ("edgedb" in GlobalConfiguration.BACKEND)
@@ -30,6 +30,30 @@ def test_str():
     assert model.field.as_jsonable_value() == f'"{value}"'
 
 
+def test_str_jsonable_value_escapes_non_ascii():
+    class SampleModel(Model):
+        field: fields.Str
+
+    value = "안녕 hello"
+    assert SampleModel(field=value).field.as_jsonable_value() == '"\\uc548\\ub155 hello"'
+
+
+def test_subclass_db_type():
+    class MyStr(fields.Str):
+        pass
+
+    class TypedStr(fields.Str):
+        _db_field_type = "str"
+
+    class InheritedStr(TypedStr):
+        pass
+
+    with pytest.raises(AttributeError):
+        MyStr.as_db_type()
+    assert TypedStr.as_db_type() == "str"
+    assert InheritedStr.as_db_type() == "str"
+
+
 @skip_if_not_edgedb
 @pytest.mark.parametrize(
     ["field_type", "value", "expected_db_type"],
@@ -85,7 +109,7 @@ def test_bigint():
         field: fields.BigInt
 
     expected_db_type = "bigint"
-    expected_python_value = int(1e100)
+    expected_python_value = 10**100
     value = "1e+100n"
     model = SampleModel(field=value)
     assert model.field == value
@@ -94,6 +118,9 @@ def test_bigint():
     assert model.field.as_python_value() == expected_python_value
     assert model.field.as_jsonable_value() == f'"{value}"'
 
+    model = SampleModel(field="9007199254740993n")
+    assert model.field.as_python_value() == 9007199254740993
+
 
 @skip_if_not_edgedb
 @pytest.mark.parametrize(
@@ -254,6 +281,8 @@ def test_datetime(
     assert model.field.as_db_value() == expected_db_value
     assert model.field.as_python_value() == expected_db_value
     assert model.field.as_jsonable_value() == expected_json_value
+    assert model.field == expected_db_value
+    assert getattr(model.field, "tzinfo", None) is getattr(expected_db_value, "tzinfo", None)
 
 
 @skip_if_not_edgedb
@@ -262,6 +291,7 @@ def test_datetime(
     [
         [datetime.timedelta(days=1), "24 hours"],
         [datetime.timedelta(days=3, hours=10, seconds=5), "82 hours 5 seconds"],
+        [datetime.timedelta(minutes=2, microseconds=7), "2 minutes 7 microseconds"],
     ],
 )
 def test_duration(value, expected_json_value):
@@ -369,6 +399,7 @@ def test_uuids(field_type: Type[fields.BaseField], value, expected_db_type):
     assert model.field == value
     assert model.field.as_db_type() == expected_db_type
     assert model.field.as_db_value() == str(value)
+    assert model.field.as_db_value() is model.field.as_db_value()
 
 
 @skip_if_not_edgedb
@@ -398,6 +429,11 @@ def test_array():
     assert model.field.as_db_value() == value
     assert model.field.as_python_value() == value
 
+    model.field.append("qwer")
+    assert model.field.index("qwer") == 1
+    assert model.field.count("asdf") == 1
+    assert model.field.as_db_value() == ["asdf", "qwer"]
+
 
 @skip_if_not_edgedb
 def test_set():
@@ -441,3 +477,40 @@ def test_namedtuple():
     assert model.field.data == value
     assert model.field.as_db_value() == list(value)
     assert model.field.as_python_value() == tuple(value)
+
+
+def test_tuple_validate_returns_validated_value():
+    value = fields.Tuple.validate(("asdf",))
+    assert fields.Tuple.validate(value) is value
+
+    # mutable sequences are still copied
+    array = fields.Array.validate(["asdf"])
+    assert fields.Array.validate(array) is not array
+    assert fields.Array.validate(array).data == array.data
+
+
+@pytest.mark.parametrize(
+    ["field_type", "value"],
+    [
+        [fields.Str, "hello"],
+        [fields.Int16, 1],
+        [fields.Bool, True],
+        [fields.Bytes, b"hello"],
+        [fields.Array, ["hello"]],
+    ],
+)
+def test_get_validators(field_type: Type[fields.BaseField], value: Any):
+    validators = tuple(field_type.get_validators())
+    assert validators == tuple(field_type.__get_validators__())
+    assert validators[-1] == field_type.validate
+
+    for _ in range(2):
+        assert tuple(field_type.get_validators()) == validators
+        assert tuple(field_type.__get_validators__()) == validators
+
+    assert validators.count(field_type.validate) == 1
+
+    class SampleModel(Model):
+        field: field_type
+
+    assert isinstance(SampleModel(field=value).field, field_type)
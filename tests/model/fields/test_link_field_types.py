@@ -1,3 +1,7 @@
+import uuid
+
+from edgedb.datatypes.datatypes import create_object_factory
+
 from nodeedge.model import fields, Model, LinkPropertyModel
 from _testing.decorators import skip_if_not_edgedb
 
@@ -33,6 +37,7 @@ def test_single_link():
     assert model.link.is_single_link
     assert model.prop.is_single_link
     assert hasattr(model.link, "name")
+    assert model.link.name == target.name
     assert model.link.get_link_data() == target
 
     assert model.prop.get_link_data() == target2
@@ -66,3 +71,13 @@ def test_multi_link():
     assert prop_item1.get_link_property() == target_prop
     assert prop_item2.get_link_data() == target2
     assert prop_item2.get_link_property() == target2_prop
+
+
+def test_link_edgedb_object_attribute():
+    obj = create_object_factory(id="property", name="property")(uuid.uuid4(), "hello")
+
+    link = fields.Link.validate(obj)
+
+    assert link.name == "hello"
+    assert hasattr(link, "name")
+    assert not hasattr(link, "missing")
@@ -1,3 +1,5 @@
+from typing import List
+
 import pydantic
 
 from nodeedge.model import fields, Model, LinkPropertyModel
@@ -54,3 +56,104 @@ def test_link_fields():
         assert nodeedge.is_multi_link is _is_multi
         assert nodeedge.link_model is Target
         assert nodeedge.link_property_model is _link_prop
+
+
+@skip_if_not_edgedb
+def test_model_fields_share_equal_nodeedge_field_info():
+    class SampleModel(Model):
+        hello: fields.Str
+        world: fields.Int16
+
+    hello_info = SampleModel.hello.field_info.nodeedge
+    assert hello_info == SampleModel.world.field_info.nodeedge
+    assert hello_info is SampleModel.world.field_info.nodeedge
+
+
+@skip_if_not_edgedb
+def test_deferred_field_info_is_resolved_with_forward_refs():
+    class SampleModel(Model):
+        link: "fields.Link[TargetModel, None]"  # noqa: F821
+
+    assert SampleModel.link.field_info.nodeedge.deferred
+
+    class TargetModel(Model):
+        name: fields.Str
+
+    SampleModel.update_forward_refs(TargetModel=TargetModel)
+
+    nodeedge_field_info = SampleModel.link.field_info.nodeedge
+    assert not nodeedge_field_info.deferred
+    assert nodeedge_field_info.is_single_link
+    assert nodeedge_field_info.link_model is TargetModel
+    assert SampleModel(link=TargetModel(name="hello")).link.name == "hello"
+
+
+@skip_if_not_edgedb
+def test_model_field_clone():
+    class SampleModel(Model):
+        hello: fields.Str
+
+    field = SampleModel.hello
+    cloned = field._clone(attrs={"__value__": "world"})
+
+    assert isinstance(cloned, fields.Field)
+    assert cloned is not field
+    assert cloned.__value__ == "world"
+    assert field.__value__ != "world"
+    assert cloned.field_info is field.field_info
+    assert cloned.name == field.name
+    assert cloned.type_ is field.type_
+
+
+def test_model_field_clone_isolation():
+    field = fields.Field(
+        name="names",
+        type_=List[fields.Str],
+        class_validators=None,
+        model_config=pydantic.BaseConfig,
+    )
+    sub_field = field.sub_fields[0]
+    sub_validators = list(sub_field.validators)
+
+    cloned = field._clone(attrs={"__value__": ["hello"]})
+    cloned.validators.append(lambda value: value)
+    cloned.sub_fields[0].validators.clear()
+    cloned.sub_fields.append(cloned)
+
+    assert field.validators == []
+    assert field.sub_fields == [sub_field]
+    assert sub_field.validators == sub_validators
+    assert field.validate(["hello"], {}, loc="names") == (["hello"], None)
+
+
+@skip_if_not_edgedb
+def test_model_class_field_clone_isolation():
+    class SampleModel(Model):
+        hello: fields.Str
+
+    field = SampleModel.hello
+    validators = list(field.validators)
+
+    cloned = field._clone(attrs={"__value__": "world"})
+    cloned.validators.clear()
+
+    assert field.validators == validators
+    assert SampleModel(hello="hello").hello == "hello"
+
+
+@skip_if_not_edgedb
+def test_model_field_eq():
+    class SampleModel(Model):
+        hello: fields.Str
+        world: fields.Str
+
+    class OtherModel(Model):
+        hello: fields.Str
+
+    field = SampleModel.hello
+    assert field == field
+    assert field == field._clone()
+    assert field != field._clone(attrs={"__value__": "world"})
+    assert field != SampleModel.world
+    assert field != OtherModel.hello
+    assert field != "hello"
@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+
+import pytest
+from pydantic.errors import ConfigError
+
+from nodeedge.model import Model, fields
+
+
+@pytest.mark.parametrize("trust", [False, True])
+def test_from_orm(trust: bool):
+    class SampleModel(Model):
+        name: fields.Str
+        age: fields.Int16 = 0
+
+        class Config:
+            trust_orm = trust
+
+    model = SampleModel.from_orm(SimpleNamespace(name="hello"))
+    assert SampleModel.__config__.trust_orm is trust
+    assert model.name == "hello"
+    assert isinstance(model.name, fields.Str)
+    assert model.name.as_python_value() == "hello"
+    assert model.name.as_db_value() == "hello"
+    assert model.age == 0
+    assert "age" not in model.__fields_set__
+
+    model = SampleModel.from_orm(SimpleNamespace(name="hello", age=10))
+    assert isinstance(model.age, fields.Int16)
+    assert model.age.as_python_value() == 10
+
+
+def test_trust_orm_requires_orm_mode():
+    class SampleModel(Model):
+        name: fields.Str
+
+        class Config:
+            orm_mode = False
+            trust_orm = True
+
+    with pytest.raises(ConfigError):
+        SampleModel.from_orm(SimpleNamespace(name="hello"))
+
+
+def test_defer_build():
+    class SampleModel(Model):
+        name: fields.Str
+
+        class Config:
+            defer_build = True
+
+    assert SampleModel.__build_pending__ is True
+    assert not isinstance(SampleModel.__fields__["name"], fields.Field)
+
+    model = SampleModel(name="hello")
+    assert SampleModel.__build_pending__ is False
+    assert isinstance(SampleModel.__fields__["name"], fields.Field)
+    assert model.name == "hello"
+
+
+def test_defer_build_on_class_access():
+    class SampleModel(Model):
+        name: fields.Str
+
+        class Config:
+            defer_build = True
+
+    class InheritedModel(SampleModel):
+        age: fields.Int16
+
+    assert SampleModel.__build_pending__ is False
+    assert InheritedModel.__build_pending__ is True
+    assert InheritedModel.age is InheritedModel.__fields__["age"]
+    assert isinstance(InheritedModel.age, fields.Field)
+    assert InheritedModel.__build_pending__ is False
+
+
+def test_class_field_access():
+    class Mixin:
+        title = None
+
+    class SampleModel(Model, Mixin):
+        name: fields.Str
+        title: fields.Str
+
+    assert SampleModel.name is SampleModel.__fields__["name"]
+    assert vars(SampleModel)["name"] is SampleModel.__fields__["name"]
+    # fields take precedence over inherited attributes of the same name
+    assert SampleModel.title is SampleModel.__fields__["title"]
+    with pytest.raises(AttributeError):
+        SampleModel.unknown
+
+
+def test_defer_build_on_field_access():
+    class SampleModel(Model):
+        name: fields.Str
+
+        class Config:
+            defer_build = True
+
+    assert SampleModel.__build_pending__ is True
+    assert not hasattr(SampleModel, "unknown")
+    assert SampleModel.__build_pending__ is True
+    assert SampleModel.name is SampleModel.__fields__["name"]
+    assert SampleModel.__build_pending__ is False
+
+
+def test_field_names():
+    class SampleModel(Model):
+        name: fields.Str
+
+    class InheritedModel(SampleModel):
+        age: fields.Int16
+
+    assert SampleModel.__field_names__ == frozenset(SampleModel.__fields__)
+    assert InheritedModel.__field_names__ == frozenset(InheritedModel.__fields__)
+    assert {"name", "age"} <= InheritedModel.__field_names__
+
+
+def test_model_hints():
+    class SampleModel(Model):
+        name: fields.Str
+
+    class OtherModel(Model):
+        name: fields.Str
+
+    assert SampleModel.__hints__ is SampleModel.__annotations__
+    assert SampleModel.__hints__ == OtherModel.__hints__ == {"name": fields.Str}
+    assert SampleModel.__hints__ is not OtherModel.__hints__
+    assert SampleModel.__fields__["name"] is not OtherModel.__fields__["name"]
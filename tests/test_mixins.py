@@ -5,6 +5,7 @@ from typing import Union, Optional
 from unittest.mock import MagicMock
 
 import pytest
+from pydantic import ValidationError
 
 from nodeedge.exceptions import InvalidPathError, NotAllowedCompositionError, NotAllowedPathError
 from nodeedge.model import Model
@@ -56,6 +57,55 @@ def test_cloneable():
     assert origin.name != obj.name
     assert origin.name2 == obj.name2
 
+    class InheritedSample(Sample):
+        pass
+
+    assert InheritedSample.__init_args__ == Sample.__init_args__
+    assert InheritedSample.__init_kwargs__ == Sample.__init_kwargs__
+
+    class PlainSample(Cloneable):
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    class OverriddenSample(PlainSample):
+        def _clone(self, **kwargs):
+            return super()._clone(**kwargs)
+
+    assert PlainSample._clone is PlainSample.__clone_impl__
+    assert PlainSample(1)._clone(args={"value": 2}).value == 2
+    assert OverriddenSample._clone is not OverriddenSample.__clone_impl__
+    assert isinstance(OverriddenSample(1)._clone(), OverriddenSample)
+
+
+def test_model_cloneable():
+    class SampleModel(Model):
+        name: fields.Str
+        age: fields.Int16 = 0
+
+    assert SampleModel.name is SampleModel.__fields__["name"]
+    with pytest.raises(AttributeError):
+        SampleModel.unknown
+
+    origin = SampleModel(name="hello", age=10)
+    cloned = origin._clone(kwargs={"age": 20})
+    assert cloned is not origin
+    assert cloned.name == origin.name
+    assert cloned.age == 20
+    assert isinstance(cloned.age, fields.Int16)
+    assert cloned.age.as_python_value() == 20
+    assert origin.age == 10
+    assert cloned.__fields_set__ == {"id", "name", "age"}
+    with pytest.raises(ValidationError):
+        origin._clone(kwargs={"age": 999999})
+    with pytest.raises(ValidationError):
+        origin._clone(kwargs={"age": "not an int"})
+
+    assert SampleModel.__plain_setattr_fields__ == frozenset(["id", "name", "age"])
+    partial = SampleModel(name="hello")
+    partial.age = 30
+    assert partial.age == 30
+    assert "age" in partial.__fields_set__
+
 
 def test_valueable():
     class Sample(Cloneable, Valueable[int]):
@@ -63,6 +113,9 @@ def test_valueable():
             self.check_value(value)
             self.__value__ = value
 
+    assert Sample.__value_type__ == frozenset([int])
+    assert Sample.__value_type_single__ is int
+
     with pytest.raises(TypeError):
         Sample("hello")
 
@@ -218,6 +271,34 @@ def test_complex_composition_map(composition_listener):
 
     assert queries == expected
 
+    queries.clear()
+    composited.map_composition()
+    assert queries == expected
+
+    # changes of operands and nested items are reflected on the next call
+    composited.right.right.operand = EnumOperand.AND
+    composited.right.__left__ = item4
+    queries.clear()
+    composited.map_composition()
+
+    # fmt: off
+    assert queries == [
+        "(",
+            item1,
+            EnumOperand.OR,
+            "(",
+                item4,
+                EnumOperand.AND,
+                "(",
+                    item3,
+                    EnumOperand.AND,
+                    item4,
+                ")",
+            ")",
+        ")",
+    ]
+    # fmt: on
+
 
 def test_pathable():
     class Sample1(Cloneable, Pathable):
@@ -293,6 +374,8 @@ def test_filterable(composition_listener):
         __listener__ = listener
 
     class Filter(Filterable[Field], Valueable, Cloneable, CompositableItem[Field, CompositedItem]):
+        __fast_clone__ = True
+
         def __init___(self, value, lookup: Optional = None):
             self.check_value(value)
             self.__value__ = value
@@ -305,6 +388,25 @@ def test_filterable(composition_listener):
     assert filter2.value == field2
     assert filter1.filter_lookup == filter2.filter_lookup == EnumLookupExpression.EQUAL
 
+    assert Filter._clone is Filter.__clone_impl__
+
+    negated = ~filter1
+    assert negated is not filter1
+    assert negated.value == field1
+    assert negated.filter_lookup == EnumLookupExpression.EQUAL | EnumLookupExpression.NOT
+    with pytest.raises(TypeError):
+        ~negated
+    assert filter1.filter_lookup == EnumLookupExpression.EQUAL
+
+    lt = filter1 < field2
+    assert lt.value == field2
+    assert lt.filter_lookup == EnumLookupExpression.LT
+    assert filter1.value == field1
+
+    in_ = filter1.in_([field1, field2])
+    assert in_.value == [field1, field2]
+    assert in_.filter_lookup == EnumLookupExpression.IN
+
     composited = filter1 & filter2
     assert composited.left == filter1
     assert composited.right == filter2
@@ -312,3 +414,33 @@ def test_filterable(composition_listener):
 
     with pytest.raises(NotAllowedCompositionError):
         filter1 & field2
+
+
+def test_filterable_clone_args():
+    class LabeledFilter(Filterable[int], Valueable, Cloneable):
+        __fast_clone__ = True
+
+        def __init__(self, value: int, *, label: str = "") -> None:
+            self.__value__ = value
+            self.label = label
+            self.title = label.upper()
+
+    origin = LabeledFilter(1, label="origin")
+    negated = ~origin
+    assert negated.title == "ORIGIN"
+    assert negated.filter_lookup == EnumLookupExpression.EQUAL | EnumLookupExpression.NOT
+
+    cloned = negated._clone(args={"value": 2}, kwargs={"label": "cloned"})
+    assert cloned.label == "cloned"
+    assert cloned.title == "CLONED"
+    assert cloned.filter_lookup == negated.filter_lookup
+    assert origin.title == "ORIGIN"
+
+    class StatefulFilter(Filterable[int], Valueable, Cloneable):
+        def __init__(self) -> None:
+            self.seen = []
+
+    assert StatefulFilter.__fast_clone__ is False
+    stateful = StatefulFilter()
+    (~stateful).seen.append(1)
+    assert stateful.seen == []